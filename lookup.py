@@ -6,12 +6,19 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import pickle
+import random
 import signal
+import sqlite3
 import sys
+import threading
 import time
-from itertools import product
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from itertools import islice, product
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 try:  # Prefer python-dotenv if available to keep parity with the Node version
@@ -19,17 +26,74 @@ try:  # Prefer python-dotenv if available to keep parity with the Node version
 except ImportError:  # pragma: no cover - optional dependency
     load_dotenv = None  # type: ignore
 
+try:  # Optional: skip known-taken domains at enumeration time
+    from pybloom_live import ScalableBloomFilter  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    ScalableBloomFilter = None  # type: ignore
+
+try:  # Optional: much faster JSON decode/encode on large payloads
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 try:
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter, Retry  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     requests = None  # type: ignore
+    HTTPAdapter = Retry = None  # type: ignore
 
 
 BATCH_SIZE = 50
 DELAY_SECONDS = 2
-LETTERS = "abcdefghijklmnopqrstuvwxyz"
+CONCURRENCY = 4
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+LETTERS = tuple("abcdefghijklmnopqrstuvwxyz")
 DEFAULT_TLD = ".com"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
 OUTPUT_FILE = Path("available.json")
+STREAM_FILE = Path("available.jsonl")
+
+# Precomputed ANSI dot prefixes so the hot result loop never re-renders them.
+GREEN_DOT = "\033[92m●\033[0m "
+YELLOW_DOT = "\033[93m●\033[0m "
+RED_DOT = "\033[91m●\033[0m "
+CACHE_FILE = Path("domain_cache.sqlite3")
+BLOOM_FILE = Path("domain_bloom.pkl")
+API_URL = "https://api.ote-godaddy.com/v1/domains/available?checkType=FULL"
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session(api_key: str, api_secret: str):
+    """Return a shared Session with pooled connections and transport retries."""
+
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            # Transport retries cover connection/read failures only. Status
+            # handling (429/5xx) lives in check_domains_batch so Retry-After
+            # and the adaptive limiter see the actual responses; a
+            # status_forcelist here would swallow them as RetryError.
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                allowed_methods=frozenset({"POST"}),
+            )
+            session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry))
+            session.headers.update(
+                {
+                    "Authorization": f"sso-key {api_key}:{api_secret}",
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                }
+            )
+            _SESSION = session
+    return _SESSION
 
 
 def load_env() -> None:
@@ -55,6 +119,15 @@ def load_env() -> None:
         os.environ.setdefault(key, value)
 
 
+def normalize_parts(values: Iterable[str]) -> List[str]:
+    """Flatten argument values, tolerating the legacy comma-separated form."""
+
+    parts: List[str] = []
+    for value in values:
+        parts.extend(part.strip() for part in value.split(","))
+    return [part for part in parts if part]
+
+
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Check domain availability using the GoDaddy API",
@@ -67,9 +140,9 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "tlds",
-        nargs="?",
-        default=DEFAULT_TLD,
-        help="Comma-separated list of TLDs (e.g. .com,.io)",
+        nargs="*",
+        default=[DEFAULT_TLD],
+        help="TLDs to check (e.g. .com .io); the leading dot is optional",
     )
     parser.add_argument(
         "--to",
@@ -101,10 +174,33 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=DELAY_SECONDS,
         help="Delay in seconds between API requests",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=CONCURRENCY,
+        help="Number of API requests to keep in flight at once",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=CACHE_TTL_SECONDS,
+        help="How long (in seconds) a cached domain verdict stays fresh",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the local SQLite cache and query every domain",
+    )
+    parser.add_argument(
+        "--no-bloom",
+        action="store_true",
+        help="Disable the Bloom filter that skips known-taken domains during enumeration",
+    )
     parser.add_argument(
         "--suffixes",
-        default="",
-        help="Comma-separated list of suffixes appended before the TLD (e.g. -app,-ai)",
+        nargs="*",
+        default=[],
+        help="Suffixes appended before the TLD (use --suffixes=-app,-ai for dash-prefixed values)",
     )
     args = parser.parse_args(argv)
 
@@ -114,47 +210,179 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         parser.error("batch-size must be at least 1")
     if args.delay < 0:
         parser.error("delay must not be negative")
+    if args.concurrency < 1:
+        parser.error("concurrency must be at least 1")
+    if args.cache_ttl < 0:
+        parser.error("cache-ttl must not be negative")
     if args.max_price is not None and args.max_price < 0:
         parser.error("--to must be a positive number")
 
+    tlds = normalize_parts(args.tlds)
+    if not tlds:
+        parser.error("at least one valid TLD is required")
+    args.tlds = [tld if tld.startswith(".") else f".{tld}" for tld in tlds]
+    args.suffixes = normalize_parts(args.suffixes) or [""]
+
     return args
 
 
-def generate_combos(length: int) -> Iterator[str]:
-    for combo in product(LETTERS, repeat=length):
-        yield "".join(combo)
+def generate_domains(length: int, suffixes: List[str], tld: str) -> Iterator[str]:
+    """Yield every candidate domain for one TLD.
+
+    The suffix+TLD tails are precomputed once so the hot loop does a
+    single concatenation per domain instead of re-formatting the suffix
+    and TLD tens of millions of times.
+    """
+
+    tails = [suffix + tld for suffix in suffixes]
+    if len(tails) == 1:
+        tail = tails[0]
+        for combo in product(LETTERS, repeat=length):
+            yield "".join(combo) + tail
+    else:
+        for combo in product(LETTERS, repeat=length):
+            base = "".join(combo)
+            for tail in tails:
+                yield base + tail
 
 
 def chunked(iterable: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
-    chunk: List[str] = []
-    for item in iterable:
-        chunk.append(item)
-        if len(chunk) == chunk_size:
-            yield chunk
-            chunk = []
-    if chunk:
-        yield chunk
+    it = iter(iterable)
+    return iter(lambda: list(islice(it, chunk_size)), [])
+
+
+class RateLimiter:
+    """Space request starts evenly so concurrent workers share one budget."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_start - now
+            self._next_start = max(self._next_start, now) + self.interval
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Pace requests off the API's X-RateLimit-* headers.
+
+    The fixed --delay interval stays in place as a minimum; on top of it,
+    wait out the rate window when the API reports it is nearly exhausted,
+    and back off exponentially (with jitter) after 429 responses.
+    """
+
+    MIN_BACKOFF = 1.0
+    MAX_BACKOFF = 60.0
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(interval)
+        self._remaining: Optional[int] = None
+        self._reset_epoch = 0.0
+        self._consecutive_429 = 0
+
+    def acquire(self) -> None:
+        super().acquire()
+        wait_for = self.backoff_interval()
+        if not wait_for:
+            with self._lock:
+                if self._remaining is not None and self._remaining <= 1:
+                    wait_for = max(0.0, self._reset_epoch - time.time())
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+    def backoff_interval(self) -> float:
+        """Current jittered backoff interval, 0.0 unless 429s are ongoing."""
+
+        with self._lock:
+            hits = self._consecutive_429
+        if not hits:
+            return 0.0
+        backoff = min(self.MAX_BACKOFF, self.MIN_BACKOFF * 2 ** (hits - 1))
+        return backoff + random.uniform(0, self.MIN_BACKOFF)
+
+    def update(self, response) -> None:
+        """Record the rate-limit state from an API response."""
+
+        with self._lock:
+            if response.status_code == 429:
+                self._consecutive_429 += 1
+            elif response.status_code < 400:
+                self._consecutive_429 = 0
+
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                try:
+                    self._remaining = int(remaining)
+                except ValueError:
+                    self._remaining = None
+
+            reset = response.headers.get("X-RateLimit-Reset")
+            if reset is not None:
+                try:
+                    reset_value = float(reset)
+                except ValueError:
+                    return
+                # The header may carry an absolute epoch or seconds until refill.
+                self._reset_epoch = reset_value if reset_value > 1e6 else time.time() + reset_value
+
+
+def json_loads(payload) -> object:
+    """Decode JSON bytes/str with orjson when available, stdlib otherwise."""
+
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def json_dumps_indented(obj: object) -> bytes:
+    """Encode an object as indented JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 
 def format_price(value: Optional[float]) -> str:
     return f" ${value:.2f}" if value is not None else ""
 
 
-def normalize_price(obj: Dict[str, object]) -> Optional[float]:
-    candidates = [
-        obj.get("price"),
-        obj.get("priceInfo", {}).get("price") if isinstance(obj.get("priceInfo"), dict) else None,
-        obj.get("period", {}).get("price") if isinstance(obj.get("period"), dict) else None,
-        obj.get("pricing", {}).get("price") if isinstance(obj.get("pricing"), dict) else None,
-    ]
-
-    for candidate in candidates:
+# Fallback locations for the price field, checked only when the usual
+# top-level "price" key is absent or non-numeric.
+_PRICE_PATHS = (("priceInfo", "price"), ("period", "price"), ("pricing", "price"))
+
+
+def _dig(obj: object, path: Tuple[str, ...]) -> object:
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def _extract_price(obj: Dict[str, object]) -> Optional[float]:
+    """Pull the raw, unscaled price out of a result, wherever the API put it."""
+
+    candidate = obj.get("price")
+    if not isinstance(candidate, (int, float)):
+        candidate = None
+        for path in _PRICE_PATHS:
+            value = _dig(obj, path)
+            if isinstance(value, (int, float)):
+                candidate = value
+                break
         if candidate is None:
-            continue
-        if isinstance(candidate, (int, float)):
-            price = float(candidate)
-            return price / 100 if price > 1000 else price
-    return None
+            return None
+    return float(candidate)
+
+
+def normalize_price(obj: Dict[str, object]) -> Optional[float]:
+    price = _extract_price(obj)
+    if price is None:
+        return None
+    return price / 100 if price > 1000 else price
 
 
 def is_available(value: object) -> bool:
@@ -174,23 +402,163 @@ def is_definitive(value: object) -> bool:
     return True  # Default to True if not specified
 
 
-def check_domains_batch(domains: List[str], api_key: str, api_secret: str, verbose: bool) -> List[Dict[str, object]]:
+def open_cache(path: Path = CACHE_FILE) -> sqlite3.Connection:
+    """Open (and create if needed) the local domain verdict cache."""
+
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS domain_cache ("
+        "domain TEXT PRIMARY KEY, available INT, price REAL, checked_at INT)"
+    )
+    conn.commit()
+    return conn
+
+
+def cache_lookup(
+    conn: sqlite3.Connection, domains: List[str], ttl: int
+) -> Tuple[List[str], List[Dict[str, object]]]:
+    """Split a batch into domains to query and fresh cached results."""
+
+    cutoff = int(time.time()) - ttl
+    placeholders = ",".join("?" * len(domains))
+    rows = conn.execute(
+        f"SELECT domain, available, price FROM domain_cache"
+        f" WHERE domain IN ({placeholders}) AND checked_at >= ?",
+        (*domains, cutoff),
+    ).fetchall()
+
+    cached: Dict[str, Dict[str, object]] = {}
+    for domain, available_flag, price in rows:
+        result: Dict[str, object] = {"domain": domain, "available": bool(available_flag)}
+        if price is not None:
+            result["price"] = price
+        cached[domain] = result
+
+    uncached = [domain for domain in domains if domain not in cached]
+    return uncached, list(cached.values())
+
+
+def cache_store(conn: sqlite3.Connection, results: List[Dict[str, object]]) -> None:
+    """Record a batch of API verdicts, replacing stale rows.
+
+    Prices are stored raw, exactly as the API sent them; cache hits flow
+    back through normalize_price like fresh results, so scaling happens
+    once either way.
+    """
+
+    now = int(time.time())
+    conn.executemany(
+        "INSERT OR REPLACE INTO domain_cache (domain, available, price, checked_at)"
+        " VALUES (?, ?, ?, ?)",
+        [
+            (result["domain"], int(is_available(result.get("available"))), _extract_price(result), now)
+            for result in results
+            if isinstance(result.get("domain"), str)
+        ],
+    )
+    conn.commit()
+
+
+def load_bloom(conn: sqlite3.Connection, ttl: int, path: Path = BLOOM_FILE):
+    """Load the persisted Bloom filter of known-taken domains, or rebuild it.
+
+    Returns a (bloom, built_at) pair, or None when pybloom_live is not
+    installed. A false positive only means a domain we might have
+    checked gets skipped, which the error rate keeps rare. Bloom filters
+    can't forget, so expiry is keyed to when the filter was built — the
+    pickle stores (built_at, filter) and is reused only while built_at
+    is inside the TTL window, no matter how recently the file was
+    rewritten. After that the filter is rebuilt from cache rows that are
+    still fresh, letting expired taken domains get re-queried like the
+    cache promises.
+    """
+
+    if ScalableBloomFilter is None:
+        return None
+
+    now = time.time()
+    if path.exists():
+        try:
+            with path.open("rb") as handle:
+                built_at, bloom = pickle.load(handle)
+        except (pickle.PickleError, EOFError, AttributeError, TypeError, ValueError):
+            pass  # Corrupt or old single-object layout; rebuild below.
+        else:
+            if isinstance(built_at, (int, float)) and now - built_at < ttl:
+                return bloom, float(built_at)
+
+    bloom = ScalableBloomFilter(initial_capacity=1_000_000, error_rate=0.001)
+    cutoff = int(now) - ttl
+    for (domain,) in conn.execute(
+        "SELECT domain FROM domain_cache WHERE available = 0 AND checked_at >= ?", (cutoff,)
+    ):
+        bloom.add(domain)
+    return bloom, now
+
+
+def save_bloom(bloom, built_at: float, path: Path = BLOOM_FILE) -> None:
+    with path.open("wb") as handle:
+        pickle.dump((built_at, bloom), handle)
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP-date."""
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def check_domains_batch(
+    domains: List[str],
+    api_key: str,
+    api_secret: str,
+    verbose: bool,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+) -> List[Dict[str, object]]:
     if requests is None:  # pragma: no cover - dependency missing
         print("❌ The 'requests' package is required. Install it with 'pip install requests'.", file=sys.stderr)
         sys.exit(1)
 
-    url = "https://api.ote-godaddy.com/v1/domains/available?checkType=FULL"
-    headers = {
-        "Authorization": f"sso-key {api_key}:{api_secret}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+    session = get_session(api_key, api_secret)
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = session.post(API_URL, json=domains, timeout=(5, 30))
+        except requests.RequestException as exc:  # pragma: no cover - network failure
+            if attempt == MAX_RETRIES:
+                print(f"⚠️  API request failed after {attempt + 1} attempts: {exc}", file=sys.stderr)
+                return []
+            wait_for = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, BACKOFF_BASE)
+            if verbose:
+                print(f"⏳ Request error ({exc}); retrying in {wait_for:.1f}s")
+            time.sleep(wait_for)
+            continue
 
-    try:
-        response = requests.post(url, headers=headers, json=domains, timeout=30)
-    except requests.RequestException as exc:  # pragma: no cover - network failure
-        print(f"⚠️  API request failed: {exc}", file=sys.stderr)
-        return []
+        if limiter is not None:
+            limiter.update(response)
+
+        if response.status_code == 429 or response.status_code >= 500:
+            if attempt == MAX_RETRIES:
+                break
+            wait_for = retry_after_seconds(response)
+            if wait_for is None and limiter is not None and response.status_code == 429:
+                wait_for = limiter.backoff_interval()
+            if wait_for is None:
+                wait_for = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, BACKOFF_BASE)
+            if verbose:
+                print(f"⏳ API returned {response.status_code}; retrying in {wait_for:.1f}s")
+            time.sleep(wait_for)
+            continue
+        break
 
     if response.status_code >= 400:
         print(f"⚠️  API Error ({response.status_code}): {response.text}")
@@ -206,7 +574,7 @@ def check_domains_batch(domains: List[str], api_key: str, api_secret: str, verbo
             )
         return []
 
-    data = response.json()
+    data = json_loads(response.content)
     # Only show JSON in verbose mode, and only for debugging API structure
     if verbose:
         print("📋 Full API Response:")
@@ -214,19 +582,79 @@ def check_domains_batch(domains: List[str], api_key: str, api_secret: str, verbo
     return data.get("domains", []) if isinstance(data, dict) else []
 
 
+def interleave_batches(
+    sources: List[Tuple[str, Iterator[List[str]]]],
+) -> Iterator[Tuple[str, List[str]]]:
+    """Round-robin batches across TLDs.
+
+    Interleaving means the wait imposed by one TLD's rate window overlaps
+    with another TLD's batches instead of leaving the pipeline idle.
+    """
+
+    queue = deque(sources)
+    while queue:
+        tld, batches = queue.popleft()
+        batch = next(batches, None)
+        if batch is None:
+            continue
+        yield tld, batch
+        queue.append((tld, batches))
+
+
+def run_batches(batches: Iterable, run_batch, concurrency: int) -> Iterator:
+    """Run batch jobs concurrently, yielding results as they complete."""
+
+    batches = iter(batches)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        in_flight = {executor.submit(run_batch, batch) for batch in islice(batches, concurrency)}
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            for batch in islice(batches, len(done)):
+                in_flight.add(executor.submit(run_batch, batch))
+
+
 def save_results(results: Dict[str, List[Dict[str, object]]]) -> None:
-    OUTPUT_FILE.write_text(json.dumps(results, indent=2))
+    OUTPUT_FILE.write_bytes(json_dumps_indented(results))
     print(f"\n💾 Results saved to {OUTPUT_FILE}")
 
 
+def consolidate_results(path: Path = STREAM_FILE) -> Dict[str, List[Dict[str, object]]]:
+    """Re-aggregate the JSONL stream into the grouped-by-TLD layout.
+
+    Entries are deduplicated by domain, keeping the newest line, so a
+    stream that ever saw the same domain twice still consolidates to one
+    entry per domain.
+    """
+
+    grouped: Dict[str, Dict[str, Dict[str, object]]] = {}
+    if not path.exists():
+        return {}
+
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json_loads(line)
+        except ValueError:
+            continue
+        tld = entry.pop("tld", None)
+        domain = entry.get("domain")
+        if not isinstance(tld, str) or not isinstance(domain, str):
+            continue
+        grouped.setdefault(tld, {})[domain] = entry
+    return {tld: list(entries.values()) for tld, entries in grouped.items()}
+
+
 def main() -> None:
     load_env()
 
     args = parse_args()
 
-    suffixes = [suffix.strip() for suffix in args.suffixes.split(",") if suffix.strip()]
-    if not suffixes:
-        suffixes = [""]
+    suffixes = args.suffixes
+    tlds = args.tlds
 
     api_key = os.environ.get("GODADDY_API_KEY")
     api_secret = os.environ.get("GODADDY_API_SECRET")
@@ -234,11 +662,6 @@ def main() -> None:
         print("❌ Missing GoDaddy API credentials in .env file", file=sys.stderr)
         sys.exit(1)
 
-    tlds = [t.strip() for t in args.tlds.split(",") if t.strip()]
-    if not tlds:
-        print("❌ No valid TLDs were provided", file=sys.stderr)
-        sys.exit(1)
-
     base_combinations = 26 ** args.letters
     total_combinations = base_combinations * len(suffixes)
     suffix_display = ", ".join(suffix or "(none)" for suffix in suffixes)
@@ -251,78 +674,125 @@ def main() -> None:
     )
     print(f"🧮 {base_combinations:,} base combinations ({total_combinations:,} variants per TLD)")
 
-    available: Dict[str, List[Dict[str, object]]] = {tld: [] for tld in tlds}
+    available_count = 0
+    # Truncate: the stream (and the available.json built from it) holds
+    # exactly this run's findings; cache hits re-emit prior discoveries.
+    stream = STREAM_FILE.open("w", buffering=1)
 
     def handle_signal(signum: int, _frame) -> None:  # pragma: no cover - signal handling
-        print(f"\n\n⚠️  Received signal {signum}. Saving current results...")
-        save_results(available)
+        print(f"\n\n⚠️  Received signal {signum}. Results are streamed to {STREAM_FILE}; exiting...")
+        stream.flush()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
 
+    # Hot-loop locals: LOAD_FAST instead of repeated attribute lookups on args.
+    verbose = args.verbose
+    only_available = args.only_available
+    max_price = args.max_price
+    cache_ttl = args.cache_ttl
+
+    limiter = AdaptiveRateLimiter(args.delay)
+    cache = None if args.no_cache else open_cache()
+    cache_lock = threading.Lock()
+    loaded_bloom = None if cache is None or args.no_bloom else load_bloom(cache, cache_ttl)
+    bloom, bloom_built_at = loaded_bloom if loaded_bloom is not None else (None, 0.0)
+
+    def run_batch(job: Tuple[str, List[str]]) -> Tuple[str, List[str], List[Dict[str, object]]]:
+        tld, batch = job
+        if cache is None:
+            to_check, cached = batch, []
+        else:
+            with cache_lock:
+                to_check, cached = cache_lookup(cache, batch, cache_ttl)
+        if not to_check:
+            return tld, batch, cached
+
+        limiter.acquire()
+        results = check_domains_batch(to_check, api_key, api_secret, verbose, limiter)
+        if cache is not None and results:
+            with cache_lock:
+                cache_store(cache, results)
+                if bloom is not None:
+                    for result in results:
+                        name = result.get("domain")
+                        if isinstance(name, str) and not is_available(result.get("available")):
+                            bloom.add(name)
+        return tld, batch, cached + results
+
+    batch_sources: List[Tuple[str, Iterator[List[str]]]] = []
     for tld in tlds:
-        print(f"\n🔍 Checking {tld} domains...")
-        processed = 0
+        domain_iterator = generate_domains(args.letters, suffixes, tld)
+        if bloom is not None:
+            domain_iterator = (domain for domain in domain_iterator if domain not in bloom)
+        batch_sources.append((tld, chunked(domain_iterator, args.batch_size)))
+
+    print(f"\n🔍 Checking {', '.join(tlds)} domains...")
+    processed_per_tld = {tld: 0 for tld in tlds}
+
+    for tld, batch, results in run_batches(
+        interleave_batches(batch_sources), run_batch, args.concurrency
+    ):
+        if verbose and results:
+            print(f"\n📊 Received {len(results)} results for this batch")
+
+        lines: List[str] = []
+        for result in results:
+            domain_name = result.get("domain")
+            if not isinstance(domain_name, str):
+                continue
+
+            available_flag = is_available(result.get("available"))
+            definitive_flag = is_definitive(result.get("definitive"))
+
+            if available_flag:
+                price = normalize_price(result)
+                include = (
+                    max_price is None
+                    or price is None
+                    or price <= max_price
+                )
+                if include:
+                    domain_info: Dict[str, object] = {"domain": domain_name}
+                    if price is not None:
+                        domain_info["price"] = price
+                    if not definitive_flag:
+                        domain_info["definitive"] = False
+                    stream.write(json.dumps({"tld": tld, **domain_info}) + "\n")
+                    stream.flush()
+                    available_count += 1
+                    if verbose:
+                        lines.append(
+                            f"{GREEN_DOT}{domain_name} (Available{' - Definitive' if definitive_flag else ' - Tentative'})\n"
+                        )
+                    else:
+                        lines.append(f"{GREEN_DOT}{domain_name}\n")
+                elif not only_available and not verbose:
+                    lines.append(f"{YELLOW_DOT}{domain_name} (too expensive)\n")
+            else:
+                if verbose:
+                    lines.append(
+                        f"{RED_DOT}{domain_name} (Taken{' - Definitive' if definitive_flag else ' - Tentative'})\n"
+                    )
+                elif not only_available:
+                    lines.append(f"{RED_DOT}{domain_name}\n")
 
-        domain_iterator = (
-            f"{combo}{suffix}{tld}"
-            for combo in generate_combos(args.letters)
-            for suffix in suffixes
-        )
+        if lines:
+            sys.stdout.write("".join(lines))
 
-        for batch in chunked(domain_iterator, args.batch_size):
-            results = check_domains_batch(batch, api_key, api_secret, args.verbose)
-            if args.verbose and results:
-                print(f"\n📊 Received {len(results)} results for this batch")
-
-            for result in results:
-                domain_name = result.get("domain")
-                if not isinstance(domain_name, str):
-                    continue
-
-                available_flag = is_available(result.get("available"))
-                definitive_flag = is_definitive(result.get("definitive"))
-                
-                if available_flag:
-                    price = normalize_price(result)
-                    include = (
-                        args.max_price is None
-                        or price is None
-                        or price <= args.max_price
-                    )
-                    if include:
-                        domain_info: Dict[str, object] = {"domain": domain_name}
-                        if price is not None:
-                            domain_info["price"] = price
-                        if not definitive_flag:
-                            domain_info["definitive"] = False
-                        available[tld].append(domain_info)
-                        if args.verbose:
-                            # Green dot for available (verbose mode shows definitive status)
-                            print(f"\033[92m●\033[0m {domain_name} (Available{' - Definitive' if definitive_flag else ' - Tentative'})")
-                        else:
-                            # Green dot for available
-                            print(f"\033[92m●\033[0m {domain_name}")
-                    else:
-                        if not args.only_available and not args.verbose:
-                            # Yellow dot for too expensive
-                            print(f"\033[93m●\033[0m {domain_name} (too expensive)")
-                else:
-                    if not args.only_available and not args.verbose:
-                        # Red dot for taken
-                        print(f"\033[91m●\033[0m {domain_name}")
-                    elif args.verbose:
-                        print(f"\033[91m●\033[0m {domain_name} (Taken{' - Definitive' if definitive_flag else ' - Tentative'})")
-
-            processed += len(batch)
-            print(
-                f"⏳ Processed {processed:,}/{total_combinations:,} for {tld}"
-            )
-            time.sleep(args.delay)
+        processed_per_tld[tld] += len(batch)
+        print(
+            f"⏳ Processed {processed_per_tld[tld]:,}/{total_combinations:,} for {tld}"
+        )
 
-    save_results(available)
-    print("✅ Done!")
+    if bloom is not None:
+        save_bloom(bloom, bloom_built_at)
+    if cache is not None:
+        cache.close()
+    stream.close()
+    save_results(consolidate_results())
+    print(f"✅ Done! Found {available_count:,} available domains this run.")
 
 
 if __name__ == "__main__":